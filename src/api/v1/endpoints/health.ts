@@ -1,69 +1,216 @@
-import { FastifyPluginAsync, FastifyReply } from "fastify";
-import { getPrismaClient } from "../../../db/client.js";
+import { FastifyPluginAsync, FastifyReply, FastifyRequest } from "fastify";
+import { pingDatabase } from "../../../db/client.js";
 import { settings, isProduction } from "../../../core/config.js";
-import { createSuccessResponse, createErrorResponse } from "../../../schemas/response.js";
-import { getMsg } from "../../../i18n/utils.js";
+import { cachedResponse } from "../../../core/cache.js";
+import {
+  createSuccessResponse,
+  createErrorResponse,
+  ErrorResponseJsonSchema,
+} from "../../../schemas/response.js";
+import { t, parseLocale, SUPPORTED_LOCALES, type Locale } from "../../../i18n/index.js";
 import { toErrorMessage } from "../../../utils/helpers.js";
 
+type HealthMessageKey = "healthy" | "alive" | "ready" | "notReady";
+
+/**
+ * 健康检查文案按语言预先解析：文案为固定字面量，探针请求只查表，不再逐请求解析 i18n key
+ */
+const HEALTH_MESSAGES = Object.fromEntries(
+  SUPPORTED_LOCALES.map((locale) => [
+    locale,
+    {
+      healthy: t("health.healthy", undefined, locale),
+      alive: t("health.alive", undefined, locale),
+      ready: t("health.ready", undefined, locale),
+      notReady: t("health.notReady", undefined, locale),
+    },
+  ])
+) as Record<Locale, Record<HealthMessageKey, string>>;
+
+const requestLocale = (request: FastifyRequest): Locale =>
+  request.locale ?? parseLocale(request.headers["accept-language"]);
+
+const healthMsg = (request: FastifyRequest, key: HealthMessageKey): string =>
+  HEALTH_MESSAGES[requestLocale(request)][key];
+
+let isoCache = { second: -1, iso: "" };
+
+/**
+ * 当前时间的 ISO 字符串，按整秒缓存：同一秒内的探针请求复用同一字符串
+ */
+const isoNow = (): string => {
+  const second = Math.floor(Date.now() / 1000);
+  if (second !== isoCache.second) {
+    isoCache = { second, iso: new Date(second * 1000).toISOString() };
+  }
+  return isoCache.iso;
+};
+
+/**
+ * 就绪检查的数据库探测结果（进程内全局缓存，expiresAt 为 performance.now() 单调时钟）
+ */
+interface ReadinessState {
+  ok: boolean;
+  timestamp: string;
+  expiresAt: number;
+  error?: string;
+}
+
+let readinessCache: ReadinessState | null = null;
+let readinessProbe: Promise<ReadinessState> | null = null;
+
+/**
+ * 返回未过期的缓存结果，无缓存或已过期返回 null
+ */
+const getCachedReadiness = (): ReadinessState | null => {
+  if (readinessCache && performance.now() < readinessCache.expiresAt) {
+    return readinessCache;
+  }
+  return null;
+};
+
+/**
+ * 执行一次数据库探测并刷新缓存；并发的未命中请求共享同一次探测（single-flight）
+ */
+const refreshReadiness = (): Promise<ReadinessState> => {
+  if (!readinessProbe) {
+    readinessProbe = (async (): Promise<ReadinessState> => {
+      const state: ReadinessState = { ok: true, timestamp: "", expiresAt: 0 };
+      try {
+        await pingDatabase();
+      } catch (error) {
+        state.ok = false;
+        state.error = toErrorMessage(error);
+      }
+      state.timestamp = isoNow();
+      state.expiresAt = performance.now() + settings.HEALTH_CACHE_TTL * 1000;
+      readinessCache = state;
+      return state;
+    })().finally(() => {
+      readinessProbe = null;
+    });
+  }
+  return readinessProbe;
+};
+
+/**
+ * 健康检查响应 Schema：声明 response schema 后 Fastify 使用预编译的 fast-json-stringify 序列化，
+ * 跳过通用 JSON.stringify（探针是调用频率最高的端点）
+ */
+const successResponseSchema = (data: Record<string, unknown>) => ({
+  type: "object",
+  properties: {
+    success: { type: "boolean" },
+    message: { type: "string" },
+    data: { type: "object", properties: data },
+  },
+});
+
+const healthSchema = {
+  response: {
+    200: successResponseSchema({
+      status: { type: "string" },
+      timestamp: { type: "string" },
+      version: { type: "string" },
+      environment: { type: "string" },
+    }),
+  },
+};
+
+const liveSchema = {
+  response: {
+    200: successResponseSchema({
+      status: { type: "string" },
+      timestamp: { type: "string" },
+    }),
+  },
+};
+
+const readySchema = {
+  response: {
+    200: successResponseSchema({
+      status: { type: "string" },
+      timestamp: { type: "string" },
+      database: { type: "string" },
+    }),
+    503: ErrorResponseJsonSchema,
+  },
+};
+
 /**
  * 健康检查路由插件
+ *
+ * 探针响应远小于压缩阈值，各路由均关闭 compress，跳过 @fastify/compress 的逐请求处理
  */
 export const healthRouter: FastifyPluginAsync = async (fastify) => {
   /**
    * 基础健康检查
    * GET /health
+   * 响应按语言缓存 HEALTH_CACHE_TTL 秒
    */
-  fastify.get("/health", async (request) => {
-    const msg = getMsg(request, "health.healthy");
-    return createSuccessResponse(msg, {
-      status: "healthy",
-      timestamp: new Date().toISOString(),
-      version: settings.APP_VERSION,
-      environment: settings.ENVIRONMENT,
-    });
-  });
+  fastify.get(
+    "/health",
+    { schema: healthSchema, compress: false },
+    cachedResponse({ ttl: settings.HEALTH_CACHE_TTL, key: requestLocale }, async (request) => {
+      const msg = healthMsg(request, "healthy");
+      return createSuccessResponse(msg, {
+        status: "healthy",
+        timestamp: isoNow(),
+        version: settings.APP_VERSION,
+        environment: settings.ENVIRONMENT,
+      });
+    })
+  );
 
   /**
    * 存活检查
    * GET /health/live
    * Kubernetes 存活探针端点
    */
-  fastify.get("/health/live", async (request) => {
-    const msg = getMsg(request, "health.alive");
+  fastify.get("/health/live", { schema: liveSchema, compress: false }, async (request) => {
+    const msg = healthMsg(request, "alive");
     return createSuccessResponse(msg, {
       status: "alive",
-      timestamp: new Date().toISOString(),
+      timestamp: isoNow(),
     });
   });
 
   /**
    * 就绪检查
    * GET /health/ready
-   * Kubernetes 就绪探针端点，检查数据库连接
+   * Kubernetes 就绪探针端点，检查数据库连接；探测结果按 HEALTH_CACHE_TTL 缓存，?nocache=1 强制刷新
    */
-  fastify.get("/health/ready", async (request, reply: FastifyReply) => {
-    try {
-      const db = getPrismaClient();
-      await db.$queryRaw`SELECT 1`;
+  fastify.get<{ Querystring: { nocache?: string } }>(
+    "/health/ready",
+    { schema: readySchema, compress: false },
+    async (request, reply: FastifyReply) => {
+      const cached = request.query.nocache === "1" ? null : getCachedReadiness();
+      const state = cached ?? (await refreshReadiness());
 
-      const msg = getMsg(request, "health.ready");
-      return createSuccessResponse(msg, {
-        status: "ready",
-        timestamp: new Date().toISOString(),
-        database: "connected",
-      });
-    } catch (error) {
-      const errorMessage = toErrorMessage(error);
-      const msg = getMsg(request, "health.notReady");
+      // 仅就绪结论可被下游缓存，max-age 取缓存剩余有效期；未就绪（503）一律 no-store
+      const maxAge = Math.ceil((state.expiresAt - performance.now()) / 1000);
+      reply.header("Cache-Control", state.ok && maxAge > 0 ? `max-age=${maxAge}` : "no-store");
+      reply.header("X-Cache", cached ? "HIT" : "MISS");
+
+      if (state.ok) {
+        const msg = healthMsg(request, "ready");
+        return createSuccessResponse(msg, {
+          status: "ready",
+          timestamp: state.timestamp,
+          database: "connected",
+        });
+      }
+
+      const msg = healthMsg(request, "notReady");
       const detail: { status: string; timestamp: string; database: string; error?: string } = {
         status: "not_ready",
-        timestamp: new Date().toISOString(),
+        timestamp: state.timestamp,
         database: "disconnected",
       };
       if (!isProduction()) {
-        detail.error = errorMessage;
+        detail.error = state.error;
       }
       return reply.status(503).send(createErrorResponse(msg, 503, detail));
     }
-  });
+  );
 };
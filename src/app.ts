@@ -1,4 +1,5 @@
 import Fastify, { FastifyInstance } from "fastify";
+import { randomUUID } from "crypto";
 import compress from "@fastify/compress";
 import cors from "@fastify/cors";
 import multipart from "@fastify/multipart";
@@ -25,10 +26,16 @@ export const createApplication = async (): Promise<FastifyInstance> => {
   const app = Fastify({
     logger: false,
     disableRequestLogging: true,
+    // 请求 ID 由 Fastify 生成一次（request.id），日志中间件与 X-Request-ID 复用同一值
+    genReqId: () => randomUUID(),
   });
 
+  // 白名单用 Set 做 O(1) 匹配；无 Origin 头的请求（如 Kubernetes 探针）直接判定为非跨域
+  const allowedOrigins = new Set(settings.CORS_ORIGINS);
   await app.register(cors, {
-    origin: settings.CORS_ORIGIN_ALLOW_ALL ? true : settings.CORS_ORIGINS,
+    origin: settings.CORS_ORIGIN_ALLOW_ALL
+      ? true
+      : (origin, callback) => callback(null, origin !== undefined && allowedOrigins.has(origin)),
     credentials: settings.CORS_CREDENTIALS,
     methods: settings.CORS_METHODS,
     allowedHeaders: settings.CORS_HEADERS,
@@ -0,0 +1,109 @@
+import type { FastifyInstance, FastifyReply, FastifyRequest } from "fastify";
+
+/**
+ * 进程内 TTL 缓存
+ *
+ * 超出容量时按写入顺序淘汰最早的条目；过期条目在读取时惰性删除
+ */
+export class TTLCache<V> {
+  private readonly store = new Map<string, { value: V; expiresAt: number }>();
+
+  constructor(private readonly maxSize: number = 1024) {}
+
+  get(key: string): V | undefined {
+    const entry = this.store.get(key);
+    if (!entry) return undefined;
+    if (performance.now() >= entry.expiresAt) {
+      this.store.delete(key);
+      return undefined;
+    }
+    return entry.value;
+  }
+
+  set(key: string, value: V, ttlMs: number): void {
+    this.store.delete(key);
+    if (this.store.size >= this.maxSize) {
+      const oldest = this.store.keys().next().value;
+      if (oldest !== undefined) this.store.delete(oldest);
+    }
+    this.store.set(key, { value, expiresAt: performance.now() + ttlMs });
+  }
+
+  delete(key: string): void {
+    this.store.delete(key);
+  }
+
+  clear(): void {
+    this.store.clear();
+  }
+
+  get size(): number {
+    return this.store.size;
+  }
+}
+
+/**
+ * 响应缓存选项
+ */
+export interface CachedResponseOptions {
+  /** 缓存时长（秒），<= 0 时不缓存 */
+  ttl: number;
+  /** 缓存键，默认使用请求 URL（含查询串）；响应随语言、用户等变化时须纳入键中 */
+  key?: (request: FastifyRequest) => string;
+  /** 单个路由最多缓存的条目数 */
+  maxSize?: number;
+}
+
+/**
+ * 路由处理函数（this 为 Fastify 实例，与 Fastify 调用处理函数的方式一致）
+ */
+type RouteHandler<T> = (
+  this: FastifyInstance,
+  request: FastifyRequest,
+  reply: FastifyReply
+) => Promise<T>;
+
+/**
+ * 为幂等 GET 路由包装进程内响应缓存
+ *
+ * 命中时直接返回缓存的响应体，不执行处理函数；仅缓存 200 且由处理函数 return 的响应体
+ * （通过 reply.send 发送的响应不缓存）。可缓存的响应附带 Cache-Control: max-age，
+ * 非 200、处理函数抛错等不可缓存的响应为 Cache-Control: no-store；均附带 X-Cache（HIT / MISS）头。
+ *
+ * 用法：fastify.get("/path", cachedResponse({ ttl: 5 }, async (request) => ...))
+ */
+export function cachedResponse<T>(
+  options: CachedResponseOptions,
+  handler: RouteHandler<T>
+): RouteHandler<T> {
+  if (options.ttl <= 0) {
+    return handler;
+  }
+
+  const cache = new TTLCache<T>(options.maxSize);
+  const ttlMs = options.ttl * 1000;
+  const cacheControl = `max-age=${options.ttl}`;
+
+  // 使用 function 而非箭头函数，以便将 Fastify 传入的 this 原样转交给处理函数
+  return async function (this: FastifyInstance, request: FastifyRequest, reply: FastifyReply) {
+    const key = options.key ? options.key(request) : request.url;
+
+    const cached = cache.get(key);
+    if (cached !== undefined) {
+      reply.header("Cache-Control", cacheControl);
+      reply.header("X-Cache", "HIT");
+      return cached;
+    }
+
+    // 先标记为不可缓存：处理函数抛错时错误响应沿用此头
+    reply.header("Cache-Control", "no-store");
+    reply.header("X-Cache", "MISS");
+
+    const result = await handler.call(this, request, reply);
+    if (reply.statusCode === 200 && (result as unknown) !== reply) {
+      cache.set(key, result, ttlMs);
+      reply.header("Cache-Control", cacheControl);
+    }
+    return result;
+  };
+}
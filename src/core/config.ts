@@ -77,6 +77,11 @@ const configSchema = z.object({
     .string()
     .transform((val) => parseInt(val, 10))
     .default("3600"),
+  /** 等待空闲连接的超时（秒），超时后请求快速失败而非长时间排队 */
+  DB_POOL_TIMEOUT: z
+    .string()
+    .transform((val) => parseInt(val, 10))
+    .default("5"),
   DB_ECHO: z
     .string()
     .transform((val) => val === "true")
@@ -137,6 +142,13 @@ const configSchema = z.object({
     }),
   LOG_FORMAT: z.string().default("json"),
 
+  // 健康检查配置
+  /** 健康检查缓存时长（秒）：/health 响应缓存与 /health/ready 数据库探测结果缓存，0 表示不缓存 */
+  HEALTH_CACHE_TTL: z
+    .string()
+    .transform((val) => parseInt(val, 10))
+    .default("5"),
+
   // 默认账户配置
   DEFAULT_ADMIN_USERNAME: z.string().default("admin"),
   DEFAULT_ADMIN_PASSWORD: z.string().default("admin123456"),
@@ -219,35 +231,65 @@ const parseConfig = (): Config => {
  */
 export const settings = parseConfig();
 
+/**
+ * 为连接 URL 补充 Prisma 连接池参数（URL 中已显式设置的参数不覆盖）
+ *
+ * 连接上限 connection_limit = DB_POOL_SIZE：Prisma 连接池没有溢出连接，建立的连接会一直保持打开，
+ * 因此不计入 DB_MAX_OVERFLOW；pool_timeout 为等待空闲连接的秒数
+ */
+const withPoolParams = (url: string): string => {
+  const params: string[] = [];
+  if (!/[?&]connection_limit=/.test(url)) {
+    params.push(`connection_limit=${settings.DB_POOL_SIZE}`);
+  }
+  if (!/[?&]pool_timeout=/.test(url)) {
+    params.push(`pool_timeout=${settings.DB_POOL_TIMEOUT}`);
+  }
+  if (params.length === 0) {
+    return url;
+  }
+  return `${url}${url.includes("?") ? "&" : "?"}${params.join("&")}`;
+};
+
+/**
+ * 由配置派生的只读值：配置在进程内不可变，导入时计算一次，避免每次调用重复拼接 / 比较
+ */
+const builtDatabaseUrl = withPoolParams(
+  `mysql://${settings.DB_USER}:${settings.DB_PASSWORD}@${settings.DB_HOST}:${settings.DB_PORT}/${settings.DB_NAME}?charset=${settings.DB_CHARSET}`
+);
+const IS_DEVELOPMENT = settings.ENVIRONMENT === Environment.DEVELOPMENT;
+const IS_PRODUCTION = settings.ENVIRONMENT === Environment.PRODUCTION;
+const IS_TESTING = settings.ENVIRONMENT === Environment.TESTING;
+
 /**
  * 获取数据库连接 URL
  */
 export const getDatabaseUrl = (): string => {
-  // 如果环境变量中已有 DATABASE_URL，优先使用
+  // 如果环境变量中已有 DATABASE_URL，优先使用（仅补充未设置的连接池参数）
   if (process.env.DATABASE_URL) {
-    return process.env.DATABASE_URL;
+    return withPoolParams(process.env.DATABASE_URL);
   }
-  // 否则根据配置构建
-  return `mysql://${settings.DB_USER}:${settings.DB_PASSWORD}@${settings.DB_HOST}:${settings.DB_PORT}/${settings.DB_NAME}?charset=${settings.DB_CHARSET}`;
+  // 否则使用根据配置构建的 URL
+  return builtDatabaseUrl;
 };
 
 /**
  * 是否为开发环境
  */
 export const isDevelopment = (): boolean => {
-  return settings.ENVIRONMENT === Environment.DEVELOPMENT;
+  return IS_DEVELOPMENT;
 };
 
 /**
  * 是否为生产环境
  */
 export const isProduction = (): boolean => {
-  return settings.ENVIRONMENT === Environment.PRODUCTION;
+  return IS_PRODUCTION;
 };
 
 /**
  * 是否为测试环境
  */
 export const isTesting = (): boolean => {
-  return settings.ENVIRONMENT === Environment.TESTING;
+  return IS_TESTING;
 };
@@ -1,3 +1,4 @@
+export * from "./cache.js";
 export * from "./config.js";
 export * from "./exceptions.js";
 export * from "./logger.js";
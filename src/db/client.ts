@@ -1,6 +1,8 @@
-import { PrismaClient } from "@prisma/client";
+import { Prisma, PrismaClient } from "@prisma/client";
 import { getLogger } from "../core/logger.js";
-import { settings, isProduction } from "../core/config.js";
+import { settings, isProduction, getDatabaseUrl } from "../core/config.js";
+import { toErrorMessage } from "../utils/helpers.js";
+import { t, type Locale } from "../i18n/index.js";
 
 const logger = getLogger("db");
 
@@ -45,6 +47,8 @@ export const getPrismaClient = (): PrismaClient => {
     });
 
     prisma = new PrismaClient({
+      // 显式传入连接 URL，使 DB_POOL_SIZE / DB_POOL_TIMEOUT 对外部提供的 DATABASE_URL 同样生效
+      datasourceUrl: getDatabaseUrl(),
       log: logConfig,
     });
 
@@ -69,6 +73,44 @@ export const getPrismaClient = (): PrismaClient => {
   return prisma;
 };
 
+/** 连接探测语句，模块加载时构建一次，避免每次探测重新创建 Sql 对象 */
+const PING_QUERY = Prisma.sql`SELECT 1`;
+
+/**
+ * 执行一次轻量数据库探测（SELECT 1）
+ */
+export const pingDatabase = async (): Promise<void> => {
+  await getPrismaClient().$queryRaw(PING_QUERY);
+};
+
+/**
+ * 预热连接池：启动时建立连接并并发执行 DB_POOL_SIZE 次探测，尽量让首批请求不承担 TCP / 认证握手耗时。
+ * 探测很快时可能复用同一连接，实际建立的连接数不保证达到 DB_POOL_SIZE，日志仅记录探测次数。
+ * 预热失败仅记录警告，不阻止启动（数据库可用性由就绪检查反映）。
+ */
+export const warmUpPool = async (): Promise<void> => {
+  const locale = (settings.DEFAULT_LOCALE as Locale) || "zh-CN";
+  const startedAt = Date.now();
+  // 固定使用当前客户端：预热期间应用关闭并清空引用时，不会再创建新的客户端
+  const client = getPrismaClient();
+  try {
+    await client.$connect();
+    await Promise.all(
+      Array.from({ length: settings.DB_POOL_SIZE }, () => client.$queryRaw(PING_QUERY))
+    );
+    logger.info({
+      message: t("db.pool.warmed", undefined, locale),
+      pings: settings.DB_POOL_SIZE,
+      elapsed: `${Date.now() - startedAt}ms`,
+    });
+  } catch (error) {
+    logger.warn({
+      message: t("db.pool.warmFailed", undefined, locale),
+      error: toErrorMessage(error),
+    });
+  }
+};
+
 /**
  * 仅清空单例引用（与 onClose / disconnectPrisma 配合，避免断开后再次返回旧实例）
  */
@@ -1,12 +1,16 @@
 import { FastifyPluginAsync } from "fastify";
-import { getPrismaClient, clearPrismaRef } from "./client.js";
+import { getPrismaClient, clearPrismaRef, warmUpPool } from "./client.js";
 
 /**
- * 数据库插件：确保 Prisma 单例在应用生命周期内可用，关闭时断开连接并清空引用。
+ * 数据库插件：确保 Prisma 单例在应用生命周期内可用，就绪时在后台预热连接池，关闭时断开连接并清空引用。
  * 业务层通过 getPrismaClient() 获取客户端，不通过 fastify.decorate。
  */
 export const dbPlugin: FastifyPluginAsync = async (fastify) => {
   const prisma = getPrismaClient();
+  fastify.addHook("onReady", async () => {
+    // 不等待预热完成：数据库不可用时不拖慢启动（initializeDatabase 已承担一次连接超时）
+    void warmUpPool();
+  });
   fastify.addHook("onClose", async () => {
     await prisma.$disconnect();
     clearPrismaRef();
@@ -110,6 +110,10 @@ export default {
       updateRequiresWhere: "Update operation requires Where conditions",
       deleteRequiresWhere: "Delete operation requires Where conditions",
     },
+    pool: {
+      warmed: "Database connection pool warmed up",
+      warmFailed: "Database connection pool warm-up failed",
+    },
   },
 
   // Authentication related
@@ -110,6 +110,10 @@ export default {
       updateRequiresWhere: "更新操作必须包含 Where 条件",
       deleteRequiresWhere: "删除操作必须包含 Where 条件",
     },
+    pool: {
+      warmed: "数据库连接池已预热",
+      warmFailed: "数据库连接池预热失败",
+    },
   },
 
   // 认证相关
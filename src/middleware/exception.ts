@@ -1,5 +1,6 @@
 import { FastifyError, FastifyReply, FastifyRequest } from "fastify";
 import { Prisma } from "@prisma/client";
+import fastJson from "fast-json-stringify";
 import { getLogger } from "../core/logger.js";
 import { settings, isProduction } from "../core/config.js";
 import {
@@ -7,7 +8,7 @@ import {
   DatabaseError,
   InternalServerError,
 } from "../core/exceptions.js";
-import { createErrorResponse } from "../schemas/response.js";
+import { createErrorResponse, ErrorResponseJsonSchema } from "../schemas/response.js";
 import { getMsg } from "../i18n/utils.js";
 import { toErrorMessage } from "../utils/helpers.js";
 
@@ -18,6 +19,13 @@ function allowDetailInResponse(): boolean {
 
 const logger = getLogger("exception");
 
+/**
+ * 错误响应序列化函数：模块加载时按 ErrorResponseJsonSchema 编译一次，所有路由共用。
+ * reply.compileSerializationSchema 按路由上下文缓存，每个路由的首个错误都会重新生成代码，
+ * 错误集中爆发时（如数据库故障）反而落在最慢的路径上
+ */
+const serializeErrorResponse = fastJson(ErrorResponseJsonSchema);
+
 /**
  * 为错误响应补上 CORS 头（错误路径可能不经过 CORS 插件）
  */
@@ -29,6 +37,26 @@ function setCorsHeaders(request: FastifyRequest, reply: FastifyReply): void {
   reply.header("Access-Control-Allow-Headers", "*");
 }
 
+/**
+ * 发送统一格式的错误响应（messageKey 为 i18n key）
+ *
+ * 使用预编译的 serializeErrorResponse，避免错误响应逐个走通用 JSON.stringify
+ */
+function sendError(
+  request: FastifyRequest,
+  reply: FastifyReply,
+  statusCode: number,
+  messageKey: string,
+  detail?: unknown
+): void {
+  const message = getMsg(request, messageKey);
+  reply
+    .status(statusCode)
+    .type("application/json; charset=utf-8")
+    .serializer(serializeErrorResponse)
+    .send(createErrorResponse(message, statusCode, detail));
+}
+
 /**
  * 异常处理函数
  */
@@ -50,14 +78,7 @@ export const errorHandler = (
       method: request.method,
     });
 
-    const message = getMsg(request, error.message);
-    const errorResponse = createErrorResponse(
-      message,
-      error.statusCode,
-      error.detail
-    );
-
-    reply.status(error.statusCode).send(errorResponse);
+    sendError(request, reply, error.statusCode, error.message, error.detail);
     return;
   }
 
@@ -77,14 +98,13 @@ export const errorHandler = (
       meta: error.meta,
     });
 
-    const message = getMsg(request, dbError.message);
-    const errorResponse = createErrorResponse(
-      message,
+    sendError(
+      request,
+      reply,
       dbError.statusCode,
+      dbError.message,
       allowDetailInResponse() ? toErrorMessage(error) : undefined
     );
-
-    reply.status(dbError.statusCode).send(errorResponse);
     return;
   }
 
@@ -99,14 +119,13 @@ export const errorHandler = (
 
     const dbError = new DatabaseError("error.dbConnectionFailed", error.message);
 
-    const message = getMsg(request, dbError.message);
-    const errorResponse = createErrorResponse(
-      message,
+    sendError(
+      request,
+      reply,
       dbError.statusCode,
+      dbError.message,
       allowDetailInResponse() ? toErrorMessage(error) : undefined
     );
-
-    reply.status(dbError.statusCode).send(errorResponse);
     return;
   }
 
@@ -121,13 +140,11 @@ export const errorHandler = (
   });
 
   const internalError = new InternalServerError("error.internalServerError");
-  const message = getMsg(request, internalError.message);
-
-  const errorResponse = createErrorResponse(
-    message,
+  sendError(
+    request,
+    reply,
     internalError.statusCode,
+    internalError.message,
     allowDetailInResponse() ? errMsg : undefined
   );
-
-  reply.status(internalError.statusCode).send(errorResponse);
 };
@@ -1,5 +1,4 @@
 import { FastifyPluginAsync, FastifyRequest, FastifyReply } from "fastify";
-import { randomUUID } from "crypto";
 import { getLogger } from "../core/logger.js";
 import { settings } from "../core/config.js";
 import { t, type Locale } from "../i18n/index.js";
@@ -25,13 +24,24 @@ declare module "fastify" {
  * - 请求方法、路径
  * - 请求处理时间
  * - 响应状态码
+ *
+ * 健康检查探针（/health、/health/live、/health/ready）仍分配请求 ID，但不记录请求日志
  */
-export const loggingPlugin: FastifyPluginAsync = async (fastify) => {
+const plugin: FastifyPluginAsync = async (fastify) => {
+  const probePaths = new Set(
+    ["/health", "/health/live", "/health/ready"].map((path) => `${settings.API_V1_PREFIX}${path}`)
+  );
+  const isProbe = (request: FastifyRequest): boolean =>
+    probePaths.has(request.routeOptions.url ?? "");
+
   // 添加请求 ID 到请求对象
   fastify.addHook("onRequest", async (request: FastifyRequest) => {
-    request.requestId = randomUUID();
+    request.requestId = request.id;
     request.requestStartTime = Date.now();
 
+    // 探针请求或级别未启用时跳过日志对象与文案的构建
+    if (isProbe(request) || !logger.isLevelEnabled("info")) return;
+
     logger.info({
       message: t("log.request.start", undefined, logLocale()),
       requestId: request.requestId,
@@ -43,11 +53,28 @@ export const loggingPlugin: FastifyPluginAsync = async (fastify) => {
     });
   });
 
+  // 在响应发送前写入请求 ID 与处理耗时头（onResponse 时响应已发出，设置的头不会生效）
+  fastify.addHook("onSend", async (
+    request: FastifyRequest,
+    reply: FastifyReply,
+    payload: unknown
+  ) => {
+    const elapsed =
+      request.requestStartTime != null ? Date.now() - request.requestStartTime : 0;
+
+    reply.header("X-Request-ID", request.requestId);
+    reply.header("X-Process-Time", elapsed.toFixed(3));
+    return payload;
+  });
+
   // 记录响应信息
   fastify.addHook("onResponse", async (
     request: FastifyRequest,
     reply: FastifyReply
   ) => {
+    // 探针请求或级别未启用时跳过日志对象与文案的构建
+    if (isProbe(request) || !logger.isLevelEnabled("info")) return;
+
     const elapsed =
       request.requestStartTime != null ? Date.now() - request.requestStartTime : 0;
     const responseTimeMs = elapsed;
@@ -60,9 +87,6 @@ export const loggingPlugin: FastifyPluginAsync = async (fastify) => {
       statusCode: reply.statusCode,
       responseTime: `${responseTimeMs.toFixed(3)}ms`,
     });
-
-    reply.header("X-Request-ID", request.requestId);
-    reply.header("X-Process-Time", responseTimeMs.toFixed(3));
   });
 
   // 记录错误信息
@@ -88,3 +112,8 @@ export const loggingPlugin: FastifyPluginAsync = async (fastify) => {
     });
   });
 };
+
+/**
+ * 跳过插件封装（等同 fastify-plugin）：钩子注册到根实例，作用于之后注册的全部路由（含 apiV1Router）
+ */
+export const loggingPlugin = Object.assign(plugin, { [Symbol.for("skip-override")]: true });
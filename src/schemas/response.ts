@@ -29,6 +29,19 @@ export const ErrorResponseSchema = z.object({
   status_code: z.number(),
 });
 
+/**
+ * 错误响应 JSON Schema（供 Fastify 预编译序列化函数；detail 为任意结构）
+ */
+export const ErrorResponseJsonSchema = {
+  type: "object",
+  properties: {
+    success: { type: "boolean" },
+    message: { type: "string" },
+    detail: {},
+    status_code: { type: "number" },
+  },
+} as const;
+
 /**
  * 分页元数据模型
  */
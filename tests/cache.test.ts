@@ -0,0 +1,146 @@
+import { describe, it, expect, afterEach } from "vitest";
+import Fastify, { type FastifyInstance } from "fastify";
+import { TTLCache, cachedResponse } from "../src/core/cache.js";
+
+describe("TTLCache", () => {
+  it("should return stored value before expiry", () => {
+    const cache = new TTLCache<string>();
+    cache.set("a", "value", 60_000);
+    expect(cache.get("a")).toBe("value");
+  });
+
+  it("should drop expired entries on read", () => {
+    const cache = new TTLCache<string>();
+    cache.set("a", "value", 0);
+    expect(cache.get("a")).toBeUndefined();
+    expect(cache.size).toBe(0);
+  });
+
+  it("should evict the oldest entry when full", () => {
+    const cache = new TTLCache<number>(2);
+    cache.set("a", 1, 60_000);
+    cache.set("b", 2, 60_000);
+    cache.set("c", 3, 60_000);
+    expect(cache.get("a")).toBeUndefined();
+    expect(cache.get("b")).toBe(2);
+    expect(cache.get("c")).toBe(3);
+  });
+});
+
+describe("cachedResponse", () => {
+  let app: FastifyInstance;
+
+  afterEach(async () => {
+    if (app) await app.close();
+  });
+
+  it("should serve a MISS then a HIT without re-running the handler", async () => {
+    let calls = 0;
+    app = Fastify();
+    app.get(
+      "/item",
+      cachedResponse({ ttl: 30 }, async () => ({ calls: ++calls }))
+    );
+
+    const first = await app.inject({ method: "GET", url: "/item" });
+    const second = await app.inject({ method: "GET", url: "/item" });
+
+    expect(first.headers["x-cache"]).toBe("MISS");
+    expect(first.headers["cache-control"]).toBe("max-age=30");
+    expect(second.headers["x-cache"]).toBe("HIT");
+    expect(second.headers["cache-control"]).toBe("max-age=30");
+    expect(JSON.parse(second.body)).toEqual({ calls: 1 });
+    expect(calls).toBe(1);
+  });
+
+  it("should not store or mark cacheable non-200 responses", async () => {
+    let calls = 0;
+    app = Fastify();
+    app.get(
+      "/item",
+      cachedResponse({ ttl: 30 }, async (_request, reply) => {
+        calls++;
+        reply.code(202);
+        return { accepted: true };
+      })
+    );
+
+    const first = await app.inject({ method: "GET", url: "/item" });
+    const second = await app.inject({ method: "GET", url: "/item" });
+
+    expect(first.statusCode).toBe(202);
+    expect(first.headers["cache-control"]).toBe("no-store");
+    expect(second.headers["x-cache"]).toBe("MISS");
+    expect(calls).toBe(2);
+  });
+
+  it("should mark error responses as no-store", async () => {
+    app = Fastify();
+    app.get(
+      "/item",
+      cachedResponse({ ttl: 30 }, async () => {
+        throw new Error("boom");
+      })
+    );
+
+    const response = await app.inject({ method: "GET", url: "/item" });
+
+    expect(response.statusCode).toBe(500);
+    expect(response.headers["cache-control"]).toBe("no-store");
+  });
+
+  it("should pass through without caching when ttl <= 0", async () => {
+    let calls = 0;
+    app = Fastify();
+    app.get(
+      "/item",
+      cachedResponse({ ttl: 0 }, async () => ({ calls: ++calls }))
+    );
+
+    await app.inject({ method: "GET", url: "/item" });
+    const second = await app.inject({ method: "GET", url: "/item" });
+
+    expect(second.headers["x-cache"]).toBeUndefined();
+    expect(second.headers["cache-control"]).toBeUndefined();
+    expect(calls).toBe(2);
+  });
+
+  it("should call the handler with the Fastify instance as this", async () => {
+    app = Fastify();
+    app.decorate("answer", 42);
+    app.get(
+      "/item",
+      cachedResponse({ ttl: 30 }, async function () {
+        return { answer: this.hasDecorator("answer") };
+      })
+    );
+
+    const response = await app.inject({ method: "GET", url: "/item" });
+
+    expect(JSON.parse(response.body)).toEqual({ answer: true });
+  });
+
+  it("should cache per custom key", async () => {
+    let calls = 0;
+    app = Fastify();
+    app.get(
+      "/item",
+      cachedResponse(
+        { ttl: 30, key: (request) => String(request.headers["accept-language"] ?? "") },
+        async (request) => ({ lang: request.headers["accept-language"], calls: ++calls })
+      )
+    );
+
+    const get = (url: string, lang: string) =>
+      app.inject({ method: "GET", url, headers: { "accept-language": lang } });
+    const zh = await get("/item", "zh-CN");
+    const en = await get("/item", "en-US");
+    const zhAgain = await get("/item?ignored=1", "zh-CN");
+
+    expect(zh.headers["x-cache"]).toBe("MISS");
+    expect(en.headers["x-cache"]).toBe("MISS");
+    expect(zhAgain.headers["x-cache"]).toBe("HIT");
+    expect(JSON.parse(zhAgain.body)).toEqual({ lang: "zh-CN", calls: 1 });
+    expect(calls).toBe(2);
+  });
+});
@@ -29,6 +29,24 @@ describe("Health Check Endpoints", () => {
       expect(body.data).toHaveProperty("version");
       expect(body.data).toHaveProperty("environment");
     });
+
+    it("should cache the response per locale", async () => {
+      const first = await app.inject({
+        method: "GET",
+        url: "/api/v1/health",
+        headers: { "accept-language": "en-US" },
+      });
+      const second = await app.inject({
+        method: "GET",
+        url: "/api/v1/health",
+        headers: { "accept-language": "en-US" },
+      });
+
+      expect(first.headers["x-cache"]).toBe("MISS");
+      expect(second.headers["x-cache"]).toBe("HIT");
+      expect(second.headers["cache-control"]).toMatch(/^max-age=\d+$/);
+      expect(JSON.parse(second.body).message).toBe(JSON.parse(first.body).message);
+    });
   });
 
   describe("GET /api/v1/health/live", () => {
@@ -44,6 +62,18 @@ describe("Health Check Endpoints", () => {
       expect(body.data.status).toBe("alive");
       expect(body.data).toHaveProperty("timestamp");
     });
+
+    it("should localize message by Accept-Language", async () => {
+      const response = await app.inject({
+        method: "GET",
+        url: "/api/v1/health/live",
+        headers: { "accept-language": "en-US,en;q=0.9" },
+      });
+
+      expect(response.statusCode).toBe(200);
+      const body = JSON.parse(response.body);
+      expect(body.message).toBe("Service is alive");
+    });
   });
 
   describe("GET /api/v1/health/ready", () => {
@@ -61,5 +91,21 @@ describe("Health Check Endpoints", () => {
       expect(body.data).toHaveProperty("timestamp");
       expect(body.data).toHaveProperty("database");
     });
+
+    it("should serve cached result until nocache=1 forces a fresh probe", async () => {
+      await app.inject({ method: "GET", url: "/api/v1/health/ready?nocache=1" });
+
+      const cached = await app.inject({
+        method: "GET",
+        url: "/api/v1/health/ready",
+      });
+      expect(cached.headers["x-cache"]).toBe("HIT");
+
+      const fresh = await app.inject({
+        method: "GET",
+        url: "/api/v1/health/ready?nocache=1",
+      });
+      expect(fresh.headers["x-cache"]).toBe("MISS");
+    });
   });
 });
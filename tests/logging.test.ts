@@ -0,0 +1,75 @@
+import { describe, it, expect, beforeAll, afterAll, beforeEach, vi } from "vitest";
+import type { FastifyInstance } from "fastify";
+import { createApplication } from "../src/app.js";
+
+const log = vi.hoisted(() => ({
+  info: vi.fn(),
+  warn: vi.fn(),
+  error: vi.fn(),
+  debug: vi.fn(),
+  isLevelEnabled: vi.fn(() => true),
+}));
+
+vi.mock("../src/core/logger.js", () => ({
+  logger: log,
+  getLogger: () => log,
+}));
+
+vi.mock("../src/db/init.js", () => ({
+  initializeDatabase: vi.fn(),
+}));
+
+/**
+ * 记录到指定路径的请求日志条数
+ */
+const requestLogsFor = (path: string): number =>
+  log.info.mock.calls.filter(([entry]) => (entry as { path?: string })?.path === path).length;
+
+describe("Request logging", () => {
+  let app: FastifyInstance;
+
+  beforeAll(async () => {
+    app = await createApplication();
+    await app.ready();
+  });
+
+  afterAll(async () => {
+    if (app) await app.close();
+  });
+
+  beforeEach(() => {
+    log.info.mockClear();
+  });
+
+  it("should skip request logs for probes but still set headers", async () => {
+    const response = await app.inject({ method: "GET", url: "/api/v1/health/live" });
+
+    expect(response.statusCode).toBe(200);
+    expect(requestLogsFor("/api/v1/health/live")).toBe(0);
+    expect(response.headers["x-request-id"]).toBeTruthy();
+    expect(response.headers["x-process-time"]).toMatch(/^\d+\.\d{3}$/);
+  });
+
+  it("should log and set headers for routes under the API router", async () => {
+    const response = await app.inject({
+      method: "POST",
+      url: "/api/v1/auth/admin/login",
+      payload: {},
+      headers: { "content-type": "application/json" },
+    });
+
+    expect(response.statusCode).toBe(400);
+    // 请求开始 + 请求完成
+    expect(requestLogsFor("/api/v1/auth/admin/login")).toBe(2);
+    expect(response.headers["x-request-id"]).toBeTruthy();
+    expect(response.headers["x-process-time"]).toMatch(/^\d+\.\d{3}$/);
+  });
+
+  it("should assign a distinct request ID per request", async () => {
+    const first = await app.inject({ method: "GET", url: "/" });
+    const second = await app.inject({ method: "GET", url: "/" });
+
+    expect(requestLogsFor("/")).toBe(4);
+    expect(first.headers["x-request-id"]).not.toBe(second.headers["x-request-id"]);
+  });
+});
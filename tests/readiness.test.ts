@@ -0,0 +1,85 @@
+import { describe, it, expect, beforeAll, afterAll, beforeEach, vi } from "vitest";
+import type { FastifyInstance } from "fastify";
+import { createApplication } from "../src/app.js";
+import { settings } from "../src/core/config.js";
+
+const db = vi.hoisted(() => ({
+  pingDatabase: vi.fn(),
+}));
+
+vi.mock("../src/db/client.js", async (importOriginal) => ({
+  ...(await importOriginal<typeof import("../src/db/client.js")>()),
+  pingDatabase: db.pingDatabase,
+}));
+
+vi.mock("../src/db/init.js", () => ({
+  initializeDatabase: vi.fn(),
+}));
+
+describe("Readiness probe", () => {
+  let app: FastifyInstance;
+
+  beforeAll(async () => {
+    app = await createApplication();
+    await app.ready();
+  });
+
+  afterAll(async () => {
+    if (app) await app.close();
+  });
+
+  beforeEach(() => {
+    db.pingDatabase.mockReset();
+  });
+
+  it("should report ready when ping succeeds", async () => {
+    db.pingDatabase.mockResolvedValue(undefined);
+
+    const response = await app.inject({ method: "GET", url: "/api/v1/health/ready?nocache=1" });
+
+    expect(response.statusCode).toBe(200);
+    const body = JSON.parse(response.body);
+    expect(body.data.database).toBe("connected");
+    expect(body.data).not.toHaveProperty("pool");
+    expect(db.pingDatabase).toHaveBeenCalledTimes(1);
+  });
+
+  it("should report not ready when ping fails", async () => {
+    db.pingDatabase.mockRejectedValue(new Error("connection lost"));
+
+    const response = await app.inject({ method: "GET", url: "/api/v1/health/ready?nocache=1" });
+
+    expect(response.statusCode).toBe(503);
+    const body = JSON.parse(response.body);
+    expect(body.success).toBe(false);
+    expect(body.detail.database).toBe("disconnected");
+  });
+
+  it("should send the remaining cache lifetime on a cached ready result", async () => {
+    db.pingDatabase.mockResolvedValue(undefined);
+
+    const fresh = await app.inject({ method: "GET", url: "/api/v1/health/ready?nocache=1" });
+    const cached = await app.inject({ method: "GET", url: "/api/v1/health/ready" });
+
+    expect(fresh.headers["cache-control"]).toBe(`max-age=${settings.HEALTH_CACHE_TTL}`);
+    expect(cached.statusCode).toBe(200);
+    expect(cached.headers["x-cache"]).toBe("HIT");
+    const maxAge = Number(/^max-age=(\d+)$/.exec(String(cached.headers["cache-control"]))?.[1]);
+    expect(maxAge).toBeGreaterThan(0);
+    expect(maxAge).toBeLessThanOrEqual(settings.HEALTH_CACHE_TTL);
+    expect(db.pingDatabase).toHaveBeenCalledTimes(1);
+  });
+
+  it("should mark not-ready results as no-store, cached or not", async () => {
+    db.pingDatabase.mockRejectedValue(new Error("connection lost"));
+
+    const fresh = await app.inject({ method: "GET", url: "/api/v1/health/ready?nocache=1" });
+    const cached = await app.inject({ method: "GET", url: "/api/v1/health/ready" });
+
+    expect(fresh.statusCode).toBe(503);
+    expect(fresh.headers["cache-control"]).toBe("no-store");
+    expect(cached.statusCode).toBe(503);
+    expect(cached.headers["x-cache"]).toBe("HIT");
+    expect(cached.headers["cache-control"]).toBe("no-store");
+  });
+});